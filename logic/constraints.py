@@ -56,16 +56,11 @@ class Constraints:
             self.stationary_danger_coordinates[tc.xyt] = value
 
     def get_danger_cost(self, tc: TimeCoordinate, is_stationary_action: bool) -> float:
+        # Called for every edge in A*, so the dicts are looked up directly
         if is_stationary_action:
-            return self._get_stationary_danger_cost(tc)
+            return self.stationary_danger_coordinates.get(tc.xyt, 0)
         else:
-            return self._get_moving_danger_cost(tc)
-
-    def _get_stationary_danger_cost(self, tc: TimeCoordinate) -> float:
-        return self.stationary_danger_coordinates.get(tc.xyt, 0)
-
-    def _get_moving_danger_cost(self, tc: TimeCoordinate) -> float:
-        return self.moving_danger_coordinates.get(tc.xyt, 0)
+            return self.moving_danger_coordinates.get(tc.xyt, 0)
 
     def any_tc_violates_constraint(self, tcs: Iterable[TimeCoordinate]) -> bool:
         if not self:
@@ -74,10 +69,8 @@ class Constraints:
         return any(self.tc_not_allowed(tc) for tc in tcs)
 
     def tc_violates_constraint(self, tc: TimeCoordinate) -> bool:
-        if not self:
-            return False
-
-        return self.tc_not_allowed(tc=tc)
+        # Single set lookup, an empty negative set already returns False. Called for every edge in A*
+        return (tc.x, tc.y, tc.t) in self.negative
 
     def tc_not_allowed(self, tc: TimeCoordinate) -> bool:
         return tc.xyt in self.negative
@@ -4,7 +4,6 @@ from copy import copy
 from dataclasses import dataclass, replace
 from typing import TYPE_CHECKING
 
-from logic.goals.unit_goal import DigGoal
 from objects.direction import Direction
 
 if TYPE_CHECKING:
@@ -74,13 +73,8 @@ class ScheduleInfo:
         constraints = copy(self.constraints)
         power_tracker = copy(self.power_tracker)
 
-        for unit in game_state.units:
-            if (
-                unit.is_scheduled
-                and isinstance(unit.goal, DigGoal)
-                and unit.goal.dig_c == c
-                and unit.private_action_plan
-            ):
+        for unit in game_state.board.get_scheduled_units_on_dig_c(c):
+            if unit.private_action_plan:
                 constraints.remove_negative_constraints(unit.private_action_plan.get_time_coordinates(game_state))
                 power_tracker.remove_power_requests(unit.private_action_plan.get_power_requests(game_state))
 
@@ -285,7 +285,15 @@ class Scheduler:
             goal.unit.supplies = goal.receiving_unit
             goal.receiving_unit.supplied_by = goal.unit
 
+        board = self.schedule_info.game_state.board
+        if goal.unit.goal:
+            board.remove_unit_goal(goal.unit.goal)
+
         goal.unit.schedule_goal(goal)
+        board.add_unit_goal(goal)
+
+        if isinstance(goal, DigGoal):
+            board.add_scheduled_unit_on_dig_c(goal.unit, goal.dig_c)
 
     def _remove_other_units_from_dig_goal(self, goal: DigGoal) -> None:
         game_state = self.schedule_info.game_state
@@ -301,6 +309,12 @@ class Scheduler:
             self.constraints.remove_negative_constraints(unit.private_action_plan.get_time_coordinates(game_state))
             self.power_tracker.remove_power_requests(unit.private_action_plan.get_power_requests(game_state))
 
+            if isinstance(unit.goal, DigGoal):
+                game_state.board.remove_scheduled_unit_on_dig_c(unit, unit.goal.dig_c)
+
+        if unit.goal:
+            game_state.board.remove_unit_goal(unit.goal)
+
         supplies, supplied_by = unit.supplies, unit.supplied_by
         unit.remove_goal_and_private_action_plan()
 
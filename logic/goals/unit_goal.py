@@ -401,19 +401,23 @@ class DigGoal(UnitGoal):
         self, start_tc: TimeCoordinate, dig_c: Coordinate, nr_digs: int, constraints: Constraints, board: Board
     ) -> list[UnitAction]:
         actions = []
+        dig_coordinate = DigCoordinate(x=dig_c.x, y=dig_c.y, d=1)
+        graph = self._get_dig_graph(board=board, goal=dig_coordinate, constraints=constraints)
 
         for _ in range(nr_digs):
             start_dtc = DigTimeCoordinate(*start_tc.xyt, d=0)
-            dig_coordinate = DigCoordinate(x=dig_c.x, y=dig_c.y, d=1)
-            graph = self._get_dig_graph(board=board, goal=dig_coordinate, constraints=constraints)
 
-            try:
-                new_actions = self._search_graph(graph=graph, start=start_dtc)
-            except Exception:
-                if actions:
-                    return actions
+            # Once on the dig coordinate, the search would return the same single dig action again, so skip it
+            if graph.can_complete_goal_by_digging(start_dtc):
+                new_actions = [DigAction()]
+            else:
+                try:
+                    new_actions = self._search_graph(graph=graph, start=start_dtc)
+                except Exception:
+                    if actions:
+                        return actions
 
-                raise InvalidGoalError(self)
+                    raise InvalidGoalError(self)
 
             actions.extend(new_actions)
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 from abc import abstractmethod
 from dataclasses import dataclass, replace
 from math import floor
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, ClassVar, TypeVar
 
 import numpy as np
 
@@ -20,6 +20,7 @@ if TYPE_CHECKING:
 
 
 class UnitAction(Action):
+    action_identifier: ClassVar[int]  # Action type number in the lux action array
     n: int  # Number of times to repeat the action
 
     def next_step_equal(self, other: UnitAction) -> bool:
@@ -92,17 +93,17 @@ class UnitAction(Action):
         direction = NUMBER_DIRECTION[direction]
         resource = Resource(resource)
 
-        if action_identifier == 0:
+        if action_identifier == MoveAction.action_identifier:
             return MoveAction(direction=direction, repeat=repeat, n=n)
-        elif action_identifier == 1:
+        elif action_identifier == TransferAction.action_identifier:
             return TransferAction(direction=direction, amount=amount, resource=resource, repeat=repeat, n=n)
-        elif action_identifier == 2:
+        elif action_identifier == PickupAction.action_identifier:
             return PickupAction(amount=amount, resource=resource, repeat=repeat, n=n)
-        elif action_identifier == 3:
+        elif action_identifier == DigAction.action_identifier:
             return DigAction(repeat=repeat, n=n)
-        elif action_identifier == 4:
+        elif action_identifier == SelfDestructAction.action_identifier:
             return SelfDestructAction(repeat=repeat, n=n)
-        elif action_identifier == 5:
+        elif action_identifier == RechargeAction.action_identifier:
             return RechargeAction(amount=amount, repeat=repeat, n=n)
         else:
             raise ValueError(f"Action identifier {action_identifier} is not an int between 0 and 5 (inc.)")
@@ -110,6 +111,7 @@ class UnitAction(Action):
 
 @dataclass
 class MoveAction(UnitAction):
+    action_identifier: ClassVar[int] = 0
     direction: Direction
     repeat: int = 0
     n: int = 1
@@ -123,10 +125,9 @@ class MoveAction(UnitAction):
         return 0
 
     def to_lux_output(self) -> np.ndarray:
-        action_identifier = 0
         resource = 0
         amount = 0
-        return np.array([action_identifier, self.direction.number, resource, amount, self.repeat, self.n])
+        return np.array([self.action_identifier, self.direction.number, resource, amount, self.repeat, self.n])
 
     def get_power_change(self, unit_cfg: UnitConfig, start_c: Coordinate, board: Board) -> int:
         if self.direction == Direction.CENTER:
@@ -152,7 +153,7 @@ class MoveAction(UnitAction):
         if self.direction == Direction.CENTER:
             return 0
 
-        return self.get_move_onto_cost(unit_cfg, end_c, board)
+        return self.get_power_cost(board.rubble[end_c.x, end_c.y], unit_cfg)
 
     @classmethod
     def get_move_onto_cost(cls, unit_cfg: UnitConfig, end_c: Coordinate, board: Board) -> int:
@@ -175,6 +176,7 @@ class MoveAction(UnitAction):
 
 @dataclass
 class TransferAction(UnitAction):
+    action_identifier: ClassVar[int] = 1
     direction: Direction
     amount: int
     resource: Resource
@@ -194,9 +196,8 @@ class TransferAction(UnitAction):
         return 0
 
     def to_lux_output(self) -> np.ndarray:
-        action_identifier = 1
         return np.array(
-            [action_identifier, self.direction.number, self.resource.value, self.amount, self.repeat, self.n]
+            [self.action_identifier, self.direction.number, self.resource.value, self.amount, self.repeat, self.n]
         )
 
     def get_power_change(self, unit_cfg: UnitConfig, start_c: Coordinate, board: Board) -> int:
@@ -216,6 +217,7 @@ class TransferAction(UnitAction):
 
 @dataclass
 class PickupAction(UnitAction):
+    action_identifier: ClassVar[int] = 2
     amount: int
     resource: Resource
     repeat: int = 0
@@ -237,9 +239,8 @@ class PickupAction(UnitAction):
         return 0
 
     def to_lux_output(self) -> np.ndarray:
-        action_identifier = 2
         direction = 0
-        return np.array([action_identifier, direction, self.resource.value, self.amount, self.repeat, self.n])
+        return np.array([self.action_identifier, direction, self.resource.value, self.amount, self.repeat, self.n])
 
     def get_power_change(self, unit_cfg: UnitConfig, start_c: Coordinate, board: Board) -> int:
         if self.resource == Resource.POWER:
@@ -258,6 +259,7 @@ class PickupAction(UnitAction):
 
 @dataclass
 class DigAction(UnitAction):
+    action_identifier: ClassVar[int] = 3
     repeat: int = 0
     n: int = 1
 
@@ -270,11 +272,10 @@ class DigAction(UnitAction):
         return 0
 
     def to_lux_output(self) -> np.ndarray:
-        action_identifier = 3
         direction = 0
         resource = 0
         amount = 0
-        return np.array([action_identifier, direction, resource, amount, self.repeat, self.n])
+        return np.array([self.action_identifier, direction, resource, amount, self.repeat, self.n])
 
     def get_power_change(self, unit_cfg: UnitConfig, start_c: Coordinate, board: Board) -> int:
         return -unit_cfg.DIG_COST * self.n
@@ -287,6 +288,7 @@ class DigAction(UnitAction):
 
 @dataclass
 class SelfDestructAction(UnitAction):
+    action_identifier: ClassVar[int] = 4
     repeat: int = 0
     n: int = 1
 
@@ -299,11 +301,10 @@ class SelfDestructAction(UnitAction):
         return 0
 
     def to_lux_output(self) -> np.ndarray:
-        action_identifier = 4
         direction = 0
         resource = 0
         amount = 0
-        return np.array([action_identifier, direction, resource, amount, self.repeat, self.n])
+        return np.array([self.action_identifier, direction, resource, amount, self.repeat, self.n])
 
     def get_power_change(self, unit_cfg: UnitConfig, start_c: Coordinate, board: Board) -> int:
         return -unit_cfg.SELF_DESTRUCT_COST * self.n
@@ -315,6 +316,7 @@ class SelfDestructAction(UnitAction):
 
 @dataclass
 class RechargeAction(UnitAction):
+    action_identifier: ClassVar[int] = 5
     amount: int
     repeat: int = 0
     n: int = 1
@@ -332,10 +334,9 @@ class RechargeAction(UnitAction):
         return Direction.CENTER
 
     def to_lux_output(self) -> np.ndarray:
-        action_identifier = 5
         direction = 0
         resource = 0
-        return np.array([action_identifier, direction, resource, self.amount, self.repeat, self.n])
+        return np.array([self.action_identifier, direction, resource, self.amount, self.repeat, self.n])
 
     def get_power_change(self, unit_cfg: UnitConfig, start_c: Coordinate, board: Board) -> int:
         return 0
@@ -28,6 +28,8 @@ class UnitActionPlan(ActionPlan):
         self._primitive_actions: Optional[list[UnitAction]] = None
         self._final_tc: Optional[TimeCoordinate] = None
         self._final_ptc: Optional[PowerTimeCoordinate] = None
+        self._time_coordinates: dict[GameState, List[TimeCoordinate]] = {}
+        self._power_requests: dict[GameState, List[PowerRequest]] = {}
 
     def __iadd__(self, other: list[UnitAction]) -> None:
         other = list(other)
@@ -113,6 +115,12 @@ class UnitActionPlan(ActionPlan):
         return self.primitive_actions[0] == MoveAction(Direction.CENTER)
 
     def get_power_requests(self, game_state: GameState) -> List[PowerRequest]:
+        if game_state not in self._power_requests:
+            self._power_requests[game_state] = self._get_power_requests(game_state)
+
+        return self._power_requests[game_state]
+
+    def _get_power_requests(self, game_state: GameState) -> List[PowerRequest]:
         return [
             self._create_power_request(action, tc, game_state)
             for action, tc in zip(self.primitive_actions, [self.actor.tc] + self.get_time_coordinates(game_state))
@@ -169,7 +177,12 @@ class UnitActionPlan(ActionPlan):
         Returns:
             Time coordinates.
         """
+        if game_state not in self._time_coordinates:
+            self._time_coordinates[game_state] = self._get_time_coordinates(game_state)
+
+        return self._time_coordinates[game_state]
 
+    def _get_time_coordinates(self, game_state: GameState) -> List[TimeCoordinate]:
         if self.is_empty():
             return [self.actor.tc + Direction.CENTER]
 
@@ -4,7 +4,7 @@ import logging
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from itertools import product
-from math import floor
+from math import floor, inf
 from typing import TYPE_CHECKING, Iterable, List, Optional, Set, Tuple
 
 import numpy as np
@@ -48,6 +48,7 @@ from utils.distances import (
     get_min_distance_between_pos_and_positions,
     get_min_distance_between_positions,
     get_min_distances_between_positions,
+    get_n_closests_positions_between_positions,
     get_positions_on_optimal_path_between_pos_and_pos,
 )
 from utils.image_processing import get_islands
@@ -163,10 +164,10 @@ class Factory(Actor):
 
         if self in board.player_factories and board.opp_factories:
             self._rubble_positions_to_clear_for_ore = self._get_positions_to_clear_for_resource_pathing(
-                board, self.ore_positions_distance_sorted[:5]
+                board, self.closest_ore_positions
             )
             self._rubble_positions_to_clear_for_ice = self._get_positions_to_clear_for_resource_pathing(
-                board, self.ice_positions_distance_sorted[:5]
+                board, self.closest_ice_positions
             )
 
         self.lichen_positions = np.argwhere(board.lichen_strains == self.strain_id)
@@ -214,16 +215,14 @@ class Factory(Actor):
         return sum(1 for lichen_pos in self.lichen_positions_set if board.get_lichen_at_pos(lichen_pos) > 1)
 
     def _set_positions_once(self, board: Board) -> None:
-        self.ice_positions_distance_sorted = self._get_positions_distance_sorted(board.ice_positions)
-        self.ore_positions_distance_sorted = self._get_positions_distance_sorted(board.ore_positions)
+        self.closest_ice_positions = get_n_closests_positions_between_positions(
+            board.ice_positions, self.positions, n=5
+        )
+        self.closest_ore_positions = get_n_closests_positions_between_positions(
+            board.ore_positions, self.positions, n=5
+        )
         self.connected_ice_coordinates = self._get_connected_ice_coordinates(board)
 
-    def _get_positions_distance_sorted(self, positions: np.ndarray) -> np.ndarray:
-        distances = get_min_distances_between_positions(positions, self.positions)
-        sorted_indexes = np.argsort(distances)
-        sorted_distance_positions = positions[sorted_indexes]
-        return sorted_distance_positions
-
     def _get_connected_ice_coordinates(self, board: Board) -> list[Coordinate]:
         distances = get_min_distances_between_positions(board.ice_positions, self.positions)
         connected_mask = distances == 1
@@ -912,32 +911,49 @@ class Factory(Actor):
         self, rubble_positions: Iterable[Tuple], units: Iterable[Unit], schedule_info: ScheduleInfo
     ) -> UnitGoal:
 
-        potential_assignments = [
+        potential_assignments = (
             (unit, goal)
             for unit in units
             for pos in rubble_positions
             for goal in unit.get_clear_rubble_goals(schedule_info.game_state, Coordinate(*pos))
-        ]
+        )
 
         return self.get_best_assignment(potential_assignments, schedule_info)  # type: ignore
 
     def get_best_assignment(
-        self, potential_assignments: List[Tuple[Unit, UnitGoal]], schedule_info: ScheduleInfo
+        self, potential_assignments: Iterable[Tuple[Unit, UnitGoal]], schedule_info: ScheduleInfo
     ) -> UnitGoal:
+        """Get the best version of the most promising feasible assignment.
 
-        potential_assignments = [
-            (unit, goal) for unit, goal in potential_assignments if unit.is_feasible_assignment(goal)
-        ]
+        The potential assignments are consumed in a single pass, so they can be passed lazily as a generator and the
+        goals are only evaluated once, directly after being generated.
 
-        if not potential_assignments:
+        Args:
+            potential_assignments: Potential combinations of units and goals.
+            schedule_info: Schedule Info.
+
+        Returns:
+            Best version of the goal of the most promising assignment.
+        """
+        best_assignment = None
+        best_value = -inf
+
+        for unit, goal in potential_assignments:
+            if not unit.is_feasible_assignment(goal):
+                continue
+
+            value = goal.get_best_case_value_per_step(schedule_info.game_state)
+            if best_assignment is None or value > best_value:
+                best_assignment = (unit, goal)
+                best_value = value
+
+        if best_assignment is None:
             # TODO, consider whether this sub_strategy get best assignment is valid or whether different error is needed
             raise FactorySchedulerNoValidGoalFoundError(
                 self, sub_strategy="get best assignment", reason="no potential assignments"
             )
 
-        unit, goal = max(
-            potential_assignments, key=lambda x: x[1].get_best_case_value_per_step(schedule_info.game_state)
-        )
+        unit, goal = best_assignment
         if isinstance(goal, DigGoal):
             schedule_info = schedule_info.copy_without_units_on_dig_c(goal.dig_c)
 
@@ -1072,41 +1088,64 @@ class Factory(Actor):
         return goal
 
     def _schedule_light_on_ore_task(self, schedule_info: ScheduleInfo) -> UnitGoal:
-        try:
-            return self._schedule_light_on_ore(schedule_info)
-        except Exception:
-            rubble_positions = self.get_rubble_positions_to_clear_for_ore(schedule_info.game_state)
-            if not rubble_positions:
-                raise FactorySchedulerNoValidGoalFoundError(
-                    self, "schedule light on clear rubble for ore", "no rubble positions"
+        valid_ore_positions_set = self._get_valid_ore_positions_for_light(schedule_info.game_state)
+        if valid_ore_positions_set:
+            try:
+                return self._schedule_unit_on_ore_pos(
+                    valid_ore_positions_set, self.light_available_units, schedule_info
                 )
+            except (FactorySchedulerNoValidGoalFoundError, ActorFoundNoValidGoalError) as e:
+                logger.debug(e)
 
-            return self._schedule_unit_on_rubble_pos(
-                rubble_positions,
-                self.light_available_units,
-                schedule_info,
+        return self._schedule_light_on_rubble_for_ore(schedule_info)
+
+    def _get_valid_ore_positions_for_light(self, game_state: GameState) -> Set[Tuple]:
+        return game_state.board.minable_ore_positions_set - game_state.positions_in_dig_goals
+
+    def _schedule_light_on_rubble_for_ore(self, schedule_info: ScheduleInfo) -> UnitGoal:
+        rubble_positions = self.get_rubble_positions_to_clear_for_ore(schedule_info.game_state)
+        if not rubble_positions:
+            raise FactorySchedulerNoValidGoalFoundError(
+                self, "schedule light on clear rubble for ore", "no rubble positions"
             )
 
-    def _schedule_light_on_ore(self, schedule_info: ScheduleInfo) -> UnitGoal:
-        game_state = schedule_info.game_state
-        valid_ore_positions_set = game_state.board.minable_ore_positions_set - game_state.positions_in_dig_goals
-        return self._schedule_unit_on_ore_pos(valid_ore_positions_set, self.light_available_units, schedule_info)
+        return self._schedule_unit_on_rubble_pos(rubble_positions, self.light_available_units, schedule_info)
 
     def _schedule_unit_on_ore_pos(
         self, ore_positions: Iterable[Tuple], units: Iterable[Unit], schedule_info: ScheduleInfo
     ) -> CollectOreGoal:
+        ore_positions = self._get_positions_within_collecting_distance(ore_positions, schedule_info.game_state)
 
-        potential_assignments = [
+        potential_assignments = (
             (unit, goal)
             for unit in units
             for pos in ore_positions
             for goal in unit.get_collect_ore_goals(
                 Coordinate(*pos), schedule_info.game_state, factory=self, is_supplied=False
             )
-        ]
+        )
 
         return self.get_best_assignment(potential_assignments, schedule_info)  # type: ignore
 
+    def _get_positions_within_collecting_distance(
+        self, positions: Iterable[Tuple], game_state: GameState
+    ) -> List[Tuple]:
+        """Filter the positions once on the distance to the factory, instead of for each unit and goal.
+
+        Args:
+            positions: Positions to filter.
+            game_state: Current game state.
+
+        Returns:
+            Positions that are within the max collecting distance of this factory.
+        """
+        return [
+            pos
+            for pos in positions
+            if game_state.board.get_min_distance_to_player_factory(Coordinate(*pos), self.strain_id)
+            <= CONFIG.MAX_DISTANCE_COLLECTING
+        ]
+
     def schedule_strategy_collect_ice(self, schedule_info: ScheduleInfo) -> UnitGoal:
         if self.has_heavy_unit_available:
             return self._schedule_heavy_on_ice(schedule_info)
@@ -1119,32 +1158,39 @@ class Factory(Actor):
         return self._schedule_unit_on_ice_pos(valid_ice_positions_set, self.heavy_available_units, schedule_info)
 
     def _schedule_light_on_ice_task(self, schedule_info: ScheduleInfo) -> UnitGoal:
-        try:
-            return self._schedule_light_on_ice(schedule_info)
-        except Exception:
-            rubble_positions = self.get_rubble_positions_to_clear_for_ice(schedule_info.game_state)
-            if not rubble_positions:
-                raise FactorySchedulerNoValidGoalFoundError(
-                    self, "schedule light on clear rubble for ice", "no rubble positions"
+        valid_ice_positions_set = self._get_valid_ice_positions_for_light(schedule_info.game_state)
+        if valid_ice_positions_set:
+            try:
+                return self._schedule_unit_on_ice_pos(
+                    valid_ice_positions_set, self.light_available_units, schedule_info
                 )
+            except (FactorySchedulerNoValidGoalFoundError, ActorFoundNoValidGoalError) as e:
+                logger.debug(e)
 
-            return self._schedule_unit_on_rubble_pos(rubble_positions, self.light_available_units, schedule_info)
+        return self._schedule_light_on_rubble_for_ice(schedule_info)
 
-    def _schedule_light_on_ice(self, schedule_info: ScheduleInfo) -> UnitGoal:
-        game_state = schedule_info.game_state
-        valid_ice_positions_set = game_state.board.minable_ice_positions_set - game_state.positions_in_dig_goals
-        return self._schedule_unit_on_ice_pos(valid_ice_positions_set, self.light_available_units, schedule_info)
+    def _get_valid_ice_positions_for_light(self, game_state: GameState) -> Set[Tuple]:
+        return game_state.board.minable_ice_positions_set - game_state.positions_in_dig_goals
+
+    def _schedule_light_on_rubble_for_ice(self, schedule_info: ScheduleInfo) -> UnitGoal:
+        rubble_positions = self.get_rubble_positions_to_clear_for_ice(schedule_info.game_state)
+        if not rubble_positions:
+            raise FactorySchedulerNoValidGoalFoundError(
+                self, "schedule light on clear rubble for ice", "no rubble positions"
+            )
+
+        return self._schedule_unit_on_rubble_pos(rubble_positions, self.light_available_units, schedule_info)
 
     def _schedule_unit_on_ice_pos(
         self, ice_positions: Iterable[Tuple], units: Iterable[Unit], schedule_info: ScheduleInfo
     ) -> CollectIceGoal:
 
-        potential_assignments = [
+        potential_assignments = (
             (unit, goal)
             for unit in units
             for pos in ice_positions
             for goal in unit.get_ice_goals(Coordinate(*pos), schedule_info.game_state, factory=self, is_supplied=False)
-        ]
+        )
 
         return self.get_best_assignment(potential_assignments, schedule_info)  # type: ignore
 
@@ -1153,7 +1199,7 @@ class Factory(Actor):
 
     def _schedule_unit_destroy_lichen(self, schedule_info: ScheduleInfo) -> DestroyLichenGoal:
         game_state = schedule_info.game_state
-        dig_pos_set = {c.xy for c in game_state.opp_lichen_tiles}
+        dig_pos_set = game_state.board.opp_lichen_positions_away_from_opp_heavies_set
         valid_pos = dig_pos_set - game_state.positions_in_dig_goals
 
         if game_state.real_env_steps >= CONFIG.FIRST_STEP_HEAVY_ALLOWED_TO_DESTROY_LICHEN:
@@ -1161,12 +1207,12 @@ class Factory(Actor):
         else:
             units = self.light_available_units
 
-        potential_assignments = [
+        potential_assignments = (
             (unit, goal)
             for pos in valid_pos
             for unit in units
             for goal in unit.get_destroy_lichen_goals(Coordinate(*pos), game_state)
-        ]
+        )
 
         return self.get_best_assignment(potential_assignments, schedule_info)  # type: ignore
 
@@ -714,7 +714,11 @@ class Unit(Actor):
             return False
 
         dig_c = goal.dig_c
-        distance_to_dig_c = goal.factory.min_distance_to_c(dig_c) if goal.factory else self.tc.distance_to(dig_c)
+        if goal.factory:
+            distance_to_dig_c = game_state.board.get_min_distance_to_player_factory(dig_c, goal.factory.strain_id)
+        else:
+            distance_to_dig_c = self.tc.distance_to(dig_c)
+
         return distance_to_dig_c <= CONFIG.MAX_DISTANCE_COLLECTING
 
     def _is_valid_destroy_lichen_goal(self, goal: DestroyLichenGoal, game_state: GameState) -> bool:
@@ -1,18 +1,19 @@
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Iterable, Optional
 
 import numpy as np
 
 from config import CONFIG
-from logic.goals.unit_goal import DigGoal
+from logic.goals.unit_goal import DigGoal, UnitGoal
 from objects.coordinate import Coordinate, CoordinateList
 from utils.distances import get_min_distances_between_positions, init_empty_positions
 from utils.positions import append_positions, positions_to_set
 
 if TYPE_CHECKING:
+    from lux.config import UnitConfig
     from objects.actors.factory import Factory
     from objects.actors.unit import Unit
 
@@ -34,6 +35,7 @@ class Board:
 
     def __post_init__(self) -> None:
         self.size = self.rubble.shape[0]  # Board is square
+        self._move_onto_power_costs: dict[tuple[float, float], list[list[int]]] = {}
 
         self.ice_positions = np.transpose(np.where(self.ice))
         self.ore_positions = np.transpose(np.where(self.ore))
@@ -56,6 +58,7 @@ class Board:
 
         self._pos_tuple_to_player_unit = defaultdict(lambda: None, {unit.tc.xy: unit for unit in self.player_units})
         self._pos_tuple_to_opp_unit = defaultdict(lambda: None, {unit.tc.xy: unit for unit in self.opp_units})
+        self._scheduled_units_by_dig_xy: defaultdict[tuple, list[Unit]] = defaultdict(list)
 
         valid_tiles_set = {(x, y) for x in range(self.size) for y in range(self.size)}
         self.valid_tiles_set = valid_tiles_set - self.opp_factory_tiles_set
@@ -71,6 +74,13 @@ class Board:
                 closest_factory = min(self.player_factories, key=lambda f: unit.tc.distance_to(f.center_tc))
                 closest_factory.add_unit(unit)
 
+        self._dig_goal_xy_counts = Counter(
+            unit.goal.dig_c.xy for unit in self.player_units if isinstance(unit.goal, DigGoal)
+        )
+        self._heavy_dig_goal_xy_counts = Counter(
+            unit.goal.dig_c.xy for unit in self.player_heavies if isinstance(unit.goal, DigGoal)
+        )
+
         self.player_factory_tiles = self._get_factory_tiles(self.player_factories)
         self.opp_factory_tiles = self._get_factory_tiles(self.opp_factories)
         self.player_lichen_tiles = self._get_lichen_coordinates_from_factories(factories=self.player_factories)
@@ -82,18 +92,29 @@ class Board:
             distance_to_player_factory_tiles = self._get_dis_to_player_factory_tiles_array()
             self._min_distance_to_all_player_factories = np.min(distance_to_player_factory_tiles, axis=2)
             self._min_distance_to_player_factory = np.min(self._min_distance_to_all_player_factories, axis=2)
+            # Nested lists give much faster scalar lookups than numpy indexing in the search hot loop
+            self._min_distance_to_player_factory_list = self._min_distance_to_player_factory.tolist()
 
-            self._closest_player_factory = np.argmin(self._min_distance_to_all_player_factories, axis=2)
-            self._closest_player_factory_tile = np.argmin(
+            closest_player_factory_index = np.argmin(self._min_distance_to_all_player_factories, axis=2)
+            closest_player_factory_tile_index = np.argmin(
                 distance_to_player_factory_tiles.reshape(self.size, self.size, -1, order="F"), axis=2
             )
+            # Resolved to the objects per tile once, so lookups are plain nested list indexing
+            self._closest_player_factory = [
+                [self.player_factories[i] for i in row] for row in closest_player_factory_index.tolist()
+            ]
+            self._closest_player_factory_tile = [
+                [self.player_factory_tiles[i] for i in row] for row in closest_player_factory_tile_index.tolist()
+            ]
 
         if self.opp_factory_tiles:
             distance_to_opp_factory_tiles = self._get_dis_to_opp_factory_tiles_array()
             min_distance_to_opp_player_factories = np.min(distance_to_opp_factory_tiles, axis=2)
             self._min_distance_to_opp_factory = np.min(min_distance_to_opp_player_factories, axis=2)
 
+        self._is_resource_next_to_player_factory = self._get_is_resource_next_to_player_factory()
         self._min_distance_to_opp_heavies = self._get_min_dis_tiles_to_opponent_heavies()
+        self.opp_lichen_positions_away_from_opp_heavies_set = self._get_opp_lichen_positions_away_from_opp_heavies()
         self._min_distance_to_player_factory_or_lichen = self._get_min_dis_tiles_to_positions(
             self.player_factories_or_lichen_tiles
         )
@@ -209,6 +230,19 @@ class Board:
         lichen_coordinates = np.argwhere(np.isin(self.lichen_strains, strain_ids) & (self.lichen > 0))
         return CoordinateList([Coordinate(*xy) for xy in lichen_coordinates])
 
+    def _get_is_resource_next_to_player_factory(self) -> np.ndarray:
+        if not self.player_factory_tiles:
+            return np.zeros_like(self.rubble, dtype=bool)
+
+        is_resource = (self.ice > 0) | (self.ore > 0)
+        return is_resource & (self._min_distance_to_player_factory == 1)
+
+    def _get_opp_lichen_positions_away_from_opp_heavies(self) -> set[tuple]:
+        opp_strain_ids = [f.strain_id for f in self.opp_factories]
+        is_opp_lichen = np.isin(self.lichen_strains, opp_strain_ids) & (self.lichen > 0)
+        is_away_from_opp_heavies = self._min_distance_to_opp_heavies > 1
+        return positions_to_set(np.argwhere(is_opp_lichen & is_away_from_opp_heavies))
+
     def _get_rubble_positions(self) -> np.ndarray:
         is_rubble_no_resource = self._get_is_rubble_no_resource()
 
@@ -236,13 +270,14 @@ class Board:
         return self._min_distance_to_player_factory_or_lichen[c.x, c.y]
 
     def is_valid_c_for_player(self, c: Coordinate) -> bool:
-        return c.xy in self.valid_tiles_set
+        # Tuple built directly instead of through the xy property, these checks are evaluated for every edge in A*
+        return (c.x, c.y) in self.valid_tiles_set
 
     def is_player_factory_tile(self, c: Coordinate) -> bool:
-        return c.xy in self.player_factory_tiles_set
+        return (c.x, c.y) in self.player_factory_tiles_set
 
     def is_opponent_factory_tile(self, c: Coordinate) -> bool:
-        return c.xy in self.opp_factory_tiles_set
+        return (c.x, c.y) in self.opp_factory_tiles_set
 
     def is_off_the_board(self, c: Coordinate) -> bool:
         return not self.is_off_the_board(c=c)
@@ -254,22 +289,20 @@ class Board:
         return self._pos_tuple_to_opp_unit[c.xy]
 
     def get_closest_player_factory(self, c: Coordinate) -> Factory:
-        closest_factory_index = self._closest_player_factory[c.x, c.y]
-        return self.player_factories[closest_factory_index]
+        return self._closest_player_factory[c.x][c.y]
 
     def get_min_distance_to_any_opp_factory(self, c: Coordinate) -> int:
         return self._min_distance_to_opp_factory[c.x, c.y]
 
     def get_min_distance_to_any_player_factory(self, c: Coordinate) -> int:
-        return self._min_distance_to_player_factory[c.x, c.y]
+        return self._min_distance_to_player_factory_list[c.x][c.y]
 
     def get_min_distance_to_player_factory(self, c: Coordinate, strain_id: int) -> int:
         factory_index = self._strain_id_to_index[strain_id]
         return self._min_distance_to_all_player_factories[c.x, c.y, factory_index]
 
     def get_closest_player_factory_tile(self, c: Coordinate) -> Coordinate:
-        closest_player_factory_tile_index = self._closest_player_factory_tile[c.x, c.y]
-        return self.player_factory_tiles[closest_player_factory_tile_index]
+        return self._closest_player_factory_tile[c.x][c.y]
 
     def is_rubble_tile(self, c: Coordinate) -> bool:
         return self._is_rubble_no_resource[c.x, c.y]
@@ -281,6 +314,25 @@ class Board:
         lichen_strain = self.lichen_strains[c.xy]
         return lichen_strain in {f.strain_id for f in self.opp_factories}
 
+    def get_move_onto_power_costs(self, unit_cfg: UnitConfig) -> list[list[int]]:
+        """Power cost of moving onto each tile, indexed as [x][y]. Computed for the whole board at once and cached per
+        unit type, so the cost of a move in the search is a nested list lookup.
+
+        Args:
+            unit_cfg: Unit config of the moving unit.
+
+        Returns:
+            Nested list with the power cost of moving onto each tile.
+        """
+        key = (unit_cfg.MOVE_COST, unit_cfg.RUBBLE_MOVEMENT_COST)
+        move_onto_power_costs = self._move_onto_power_costs.get(key)
+        if move_onto_power_costs is None:
+            power_costs = np.floor(unit_cfg.MOVE_COST + unit_cfg.RUBBLE_MOVEMENT_COST * self.rubble).astype(int)
+            move_onto_power_costs = power_costs.tolist()
+            self._move_onto_power_costs[key] = move_onto_power_costs
+
+        return move_onto_power_costs
+
     def get_min_dis_to_opp_heavy(self, c: Coordinate) -> float:
         return self._min_distance_to_opp_heavies[c.x, c.y]
 
@@ -300,16 +352,54 @@ class Board:
 
         return neighboring_opponents
 
+    def add_unit_goal(self, goal: UnitGoal) -> None:
+        """Register a goal that is set for a player unit, to keep track of the positions in dig goals."""
+        if not isinstance(goal, DigGoal):
+            return
+
+        self._dig_goal_xy_counts[goal.dig_c.xy] += 1
+        if goal.unit.is_heavy:
+            self._heavy_dig_goal_xy_counts[goal.dig_c.xy] += 1
+
+    def remove_unit_goal(self, goal: UnitGoal) -> None:
+        """Unregister a goal that is removed from a player unit, to keep track of the positions in dig goals."""
+        if not isinstance(goal, DigGoal):
+            return
+
+        self._decrement_xy_count(self._dig_goal_xy_counts, goal.dig_c.xy)
+        if goal.unit.is_heavy:
+            self._decrement_xy_count(self._heavy_dig_goal_xy_counts, goal.dig_c.xy)
+
+    @staticmethod
+    def _decrement_xy_count(xy_counts: Counter, xy: tuple) -> None:
+        xy_counts[xy] -= 1
+        if xy_counts[xy] <= 0:
+            del xy_counts[xy]
+
     @property
     def positions_in_dig_goals(self) -> set[tuple]:
-        return {unit.goal.dig_c.xy for unit in self.player_units if isinstance(unit.goal, DigGoal)}
+        return set(self._dig_goal_xy_counts)
 
     @property
     def positions_in_heavy_dig_goals(self) -> set[tuple]:
-        return {unit.goal.dig_c.xy for unit in self.player_units if unit.is_heavy and isinstance(unit.goal, DigGoal)}
+        return set(self._heavy_dig_goal_xy_counts)
+
+    def get_scheduled_units_on_dig_c(self, c: Coordinate) -> list[Unit]:
+        return self._scheduled_units_by_dig_xy.get(c.xy, [])
+
+    def add_scheduled_unit_on_dig_c(self, unit: Unit, c: Coordinate) -> None:
+        self._scheduled_units_by_dig_xy[c.xy].append(unit)
+
+    def remove_scheduled_unit_on_dig_c(self, unit: Unit, c: Coordinate) -> None:
+        units_on_dig_c = self._scheduled_units_by_dig_xy.get(c.xy)
+        if units_on_dig_c and unit in units_on_dig_c:
+            units_on_dig_c.remove(unit)
 
     def is_resource_c(self, c: Coordinate) -> bool:
-        return c.xy in self.resource_positions_set
+        return (c.x, c.y) in self.resource_positions_set
+
+    def is_resource_next_to_player_factory(self, c: Coordinate) -> bool:
+        return self._is_resource_next_to_player_factory[c.x, c.y]
 
     def get_lichen_at_pos(self, pos: tuple) -> int:
         return self.lichen[pos]
@@ -11,7 +11,11 @@ from objects.actions.unit_action import (
     TransferAction,
     UnitAction,
 )
-from objects.direction import Direction
+from objects.direction import (
+    DIRECTION_DELTAS,
+    NON_STATIONARY_DIRECTION_DELTAS,
+    Direction,
+)
 from objects.resource import Resource
 from utils.utils import is_day
 
@@ -54,16 +58,12 @@ class Coordinate:
         raise TypeError(f"Unexpected type of other: {type(other)}")
 
     def _add_get_new_xy_action(self, action: UnitAction) -> tuple[int, int]:
-        direction_tuple = action.unit_direction.value
-        x = self.x + direction_tuple[0] * action.n
-        y = self.y + direction_tuple[1] * action.n
-        return x, y
+        direction = action.unit_direction
+        n = action.n
+        return self.x + direction.dx * n, self.y + direction.dy * n
 
     def _add_get_new_xy_direction(self, direction: Direction) -> tuple[int, int]:
-        direction_tuple = direction.value
-        x = self.x + direction_tuple[0]
-        y = self.y + direction_tuple[1]
-        return x, y
+        return self.x + direction.dx, self.y + direction.dy
 
     def _add_get_new_xy_coordinate(self, c: Coordinate) -> tuple[int, int]:
         x = self.x + c.x
@@ -91,14 +91,14 @@ class Coordinate:
     @property
     def neighbors(self) -> list[Coordinate]:
         """Neighboring coordinates."""
-        neighbors = [self + direction for direction in Direction]
-        return neighbors
+        x, y = self.x, self.y
+        return [Coordinate(x + dx, y + dy) for dx, dy in DIRECTION_DELTAS]
 
     @property
     def non_stationary_neighbors(self) -> list[Coordinate]:
         """Neighboring coordinates, excluding the coordinate achieved by being stationary."""
-        neighbors = [self + direction for direction in Direction if direction != direction.CENTER]
-        return neighbors
+        x, y = self.x, self.y
+        return [Coordinate(x + dx, y + dy) for dx, dy in NON_STATIONARY_DIRECTION_DELTAS]
 
     def distance_to(self, c: Coordinate) -> int:
         """Manhattan distance to coordinate
@@ -145,22 +145,23 @@ class TimeCoordinate(Coordinate):
         return self.t + 1
 
     def add_action(self, action: UnitAction) -> TimeCoordinate:
-        x, y = self._add_get_new_xy_action(action)
-        t = self._add_get_new_t_action(action)
-        return TimeCoordinate(x, y, t)
+        # Computed inline instead of through the _add_get_new helpers, since this is called for every neighbor in A*
+        direction = action.unit_direction
+        n = action.n
+        return TimeCoordinate(self.x + direction.dx * n, self.y + direction.dy * n, self.t + n)
 
     def _add_get_new_t_action(self, action: UnitAction) -> int:
         return self.t + action.n
 
     @property
     def neighbors(self) -> list[TimeCoordinate]:
-        neighbors = [self + direction for direction in Direction]
-        return neighbors
+        x, y, t = self.x, self.y, self.t + 1
+        return [TimeCoordinate(x + dx, y + dy, t) for dx, dy in DIRECTION_DELTAS]
 
     @property
     def non_stationary_neighbors(self) -> list[TimeCoordinate]:
-        neighbors = [self + direction for direction in Direction if direction != Direction.CENTER]
-        return neighbors
+        x, y, t = self.x, self.y, self.t + 1
+        return [TimeCoordinate(x + dx, y + dy, t) for dx, dy in NON_STATIONARY_DIRECTION_DELTAS]
 
     @property
     def xyt(self) -> tuple[int, int, int]:
@@ -195,10 +196,11 @@ class DigTimeCoordinate(DigCoordinate, TimeCoordinate):
         return DigTimeCoordinate(x, y, t, self.d)
 
     def add_action(self, action: UnitAction) -> DigTimeCoordinate:
-        x, y = self._add_get_new_xy_action(action)
-        t = self._add_get_new_t_action(action)
-        d = self._add_get_new_d_action(action)
-        return DigTimeCoordinate(x, y, t, d)
+        # Computed inline, like TimeCoordinate.add_action, to avoid the intermediate tuples and helper calls
+        direction = action.unit_direction
+        n = action.n
+        d = self.d + n if isinstance(action, DigAction) else self.d
+        return DigTimeCoordinate(self.x + direction.dx * n, self.y + direction.dy * n, self.t + n, d)
 
 
 @dataclass(eq=True, frozen=True)
@@ -8,6 +8,11 @@ class Direction(Enum):
     DOWN = (0, 1)
     LEFT = (-1, 0)
 
+    def __init__(self, dx: int, dy: int) -> None:
+        # Plain attributes of the deltas, which are a lot faster to access than value in the search hot path
+        self.dx = dx
+        self.dy = dy
+
     @property
     def number(self) -> int:
         return DIRECTION_NUMBER[self]
@@ -22,3 +27,8 @@ DIRECTION_NUMBER: dict = {
 }
 
 NUMBER_DIRECTION = {number: direction for direction, number in DIRECTION_NUMBER.items()}
+
+DIRECTION_DELTAS: tuple = tuple(direction.value for direction in Direction)
+NON_STATIONARY_DIRECTION_DELTAS: tuple = tuple(
+    direction.value for direction in Direction if direction != Direction.CENTER
+)
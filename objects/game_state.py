@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import TYPE_CHECKING, Optional, Sequence, Set
 
 from logic.goals.unit_goal import DefendLichenTileGoal, DefendTileGoal
@@ -60,8 +61,8 @@ class GameState:
     def opp_factories(self) -> list[Factory]:
         return self.board.opp_factories
 
-    @property
-    def real_env_steps(self):
+    @cached_property
+    def real_env_steps(self) -> int:
         """
         the actual env step in the environment, which subtracts the time spent bidding and placing factories
         """
@@ -71,7 +72,7 @@ class GameState:
         else:
             return self.env_steps
 
-    @property
+    @cached_property
     def steps_left(self) -> int:
         return EnvConfig.max_episode_length - self.real_env_steps - 1
 
@@ -4,6 +4,8 @@ from abc import ABCMeta, abstractmethod
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Generator, List, Optional, Tuple
 
+import numpy as np
+
 from config import CONFIG
 from logic.constraints import Constraints
 from lux.config import HEAVY_CONFIG
@@ -31,28 +33,70 @@ if TYPE_CHECKING:
     from objects.board import Board
 
 
-@dataclass
+LIGHT_DANGER_COST_PER_DISTANCE_TO_OPP_HEAVY = {0: 50, 1: 5}
+MOVE_ACTIONS = tuple(MoveAction(direction) for direction in Direction)
+NON_STATIONARY_MOVE_ACTIONS = tuple(MoveAction(direction) for direction in Direction if direction != Direction.CENTER)
+
+
+@dataclass(eq=False)
 class Graph(metaclass=ABCMeta):
     board: Board
     time_to_power_cost: float
     unit_cfg: UnitConfig
     unit_type: str
     constraints: Constraints
+    # Graphs that only yield single step MoveActions can construct next TimeCoordinates directly
+    _only_move_actions = False
+
+    def __post_init__(self) -> None:
+        self._min_cost_per_step = self.time_to_power_cost + self.unit_cfg.MOVE_COST
+        self._is_heavy = self.unit_type == "HEAVY"
+        self._distance_heuristic_cache: dict[tuple[int, int], float] = {}
+        self._danger_cost_cache: dict[tuple[int, int], float] = {}
+        self._move_onto_power_costs = self.board.get_move_onto_power_costs(self.unit_cfg)
+
+    def get_valid_action_nodes(self, tc: TimeCoordinate) -> List[Tuple[UnitAction, TimeCoordinate]]:
+        """For the current TimeCoordinate, gets all Action and corresponding next TimeCoordinate pairs that are valid.
 
-    def get_valid_action_nodes(self, tc: TimeCoordinate) -> Generator[Tuple[UnitAction, TimeCoordinate], None, None]:
-        """For the current TimeCoordinate, generates all Action and corresponding next TimeCoordinate pairs that are
-        valid.
+        Returns a list instead of yielding the pairs, to avoid the generator overhead for the handful of pairs.
 
         Args:
             c: TimeCoordinate
 
-        Yields:
+        Returns:
             Actions and corresponding next TimeCoordinate tuples
         """
+        if self._only_move_actions and type(tc) is TimeCoordinate:
+            return self._get_valid_move_action_nodes(tc)
+
+        # Bound methods stored as locals to avoid the attribute lookups inside the loop
+        is_valid_action_node = self._is_valid_action_node
+        add_action = tc.add_action
+
+        action_nodes = []
         for action in self._get_potential_actions(tc=tc):
-            to_c = tc.add_action(action)
-            if self._is_valid_action_node(action, to_c):
-                yield action, to_c
+            to_c = add_action(action)
+            if is_valid_action_node(action, to_c):
+                action_nodes.append((action, to_c))
+
+        return action_nodes
+
+    def _get_valid_move_action_nodes(self, tc: TimeCoordinate) -> List[Tuple[UnitAction, TimeCoordinate]]:
+        """Fast path of get_valid_action_nodes for graphs that only yield single step MoveActions on TimeCoordinates,
+        which skips the add_action dispatch and builds the next TimeCoordinate from the direction deltas."""
+        is_valid_action_node = self._is_valid_action_node
+        x = tc.x
+        y = tc.y
+        t = tc.t + 1
+
+        action_nodes = []
+        for action in self._get_potential_actions(tc=tc):
+            direction = action.direction
+            to_c = TimeCoordinate(x + direction.dx, y + direction.dy, t)
+            if is_valid_action_node(action, to_c):
+                action_nodes.append((action, to_c))
+
+        return action_nodes
 
     @abstractmethod
     def _get_potential_actions(self, tc: TimeCoordinate) -> Generator[UnitAction, None, None]:
@@ -62,11 +106,19 @@ class Graph(metaclass=ABCMeta):
 
     def _is_valid_action_node(self, action: UnitAction, to_tc: TimeCoordinate) -> bool:
         """Confirms whether action node pairs are valid based on the action and the next TimeCoordinate."""
-        return (
-            not self.constraints.tc_violates_constraint(to_tc)
-            and self.board.is_valid_c_for_player(c=to_tc)
-            and not self.constraints.get_danger_cost(to_tc, action.is_stationary)
-        )
+        if not self.board.is_valid_c_for_player(c=to_tc):
+            return False
+
+        # Constraint containers are read directly with a single key, since this is evaluated for every edge in A*
+        constraints = self.constraints
+        xyt = (to_tc.x, to_tc.y, to_tc.t)
+        if xyt in constraints.negative:
+            return False
+
+        if action.is_stationary:
+            return not constraints.stationary_danger_coordinates.get(xyt, 0)
+        else:
+            return not constraints.moving_danger_coordinates.get(xyt, 0)
 
     def get_cost(self, action: UnitAction, to_c: TimeCoordinate) -> float:
         """Get the cost of the action based on the action itself and the next TimeCoordinate
@@ -77,35 +129,33 @@ class Graph(metaclass=ABCMeta):
         Returns:
             Cost of performing action
         """
-        action_power_cost = self._get_power_cost(action=action, to_c=to_c)
-        on_resource_next_to_base_cost = self._get_penalty_on_resource_next_to_base(action=action, to_c=to_c)
+        board = self.board
+        # Power cost and resource penalty are computed inline, since this is evaluated for every edge in A*
+        if action.action_identifier == MoveAction.action_identifier:
+            # Moves in the search are single steps, their cost is a lookup in the precomputed board costs
+            action_power_cost = 0 if action.is_stationary else self._move_onto_power_costs[to_c.x][to_c.y]
+        else:
+            power_change = action.get_power_change_by_end_c(unit_cfg=self.unit_cfg, end_c=to_c, board=board)
+            action_power_cost = -power_change if power_change < 0 else 0
+        # Penalty on resources next to the base, to discourage pathing on them
+        on_resource_next_to_base_cost = 1 if board.is_resource_next_to_player_factory(to_c) else 0
         danger_cost = self._get_danger_cost(action=action, to_c=to_c)
         return action_power_cost + self.time_to_power_cost + on_resource_next_to_base_cost + danger_cost
 
-    def _get_power_cost(self, action: UnitAction, to_c: TimeCoordinate) -> float:
-        power_change = action.get_power_change_by_end_c(unit_cfg=self.unit_cfg, end_c=to_c, board=self.board)
-        power_cost = max(0, -power_change)
-        return power_cost
-
-    def _get_penalty_on_resource_next_to_base(self, action: UnitAction, to_c: TimeCoordinate) -> float:
-        """Adds a penalty for coordinates next to the base, to discourage pathing on resources."""
-        if self.board.is_resource_c(to_c) and self.board.get_min_distance_to_any_player_factory(to_c) == 1:
-            return 1
-        else:
-            return 0
-
     def _get_danger_cost(self, action: UnitAction, to_c: TimeCoordinate) -> float:
         # TODO, figure out if this is duplication, there is also a danger cost in the constraints
-        if self.unit_type == "HEAVY":
+        if self._is_heavy:
             return 0
 
-        distance_to_opp_heavy = self.board.get_min_dis_to_opp_heavy(c=to_c)
-        if distance_to_opp_heavy == 0:
-            return 50
-        elif distance_to_opp_heavy == 1:
-            return 5
-        else:
-            return 0
+        # Only depends on the position, cached per (x, y) since the board lookup is slow compared to a dict lookup
+        xy = (to_c.x, to_c.y)
+        danger_cost = self._danger_cost_cache.get(xy)
+        if danger_cost is None:
+            distance_to_opp_heavy = self.board.get_min_dis_to_opp_heavy(c=to_c)
+            danger_cost = LIGHT_DANGER_COST_PER_DISTANCE_TO_OPP_HEAVY.get(distance_to_opp_heavy, 0)
+            self._danger_cost_cache[xy] = danger_cost
+
+        return danger_cost
 
     @abstractmethod
     def get_heuristic(self, tc: TimeCoordinate) -> float:
@@ -120,6 +170,18 @@ class Graph(metaclass=ABCMeta):
         """
         ...
 
+    def _get_cached_distance_heuristic(self, tc: TimeCoordinate) -> float:
+        """The distance heuristic only depends on the position, so it is cached per (x, y) during the lifetime of the
+        graph, since A* evaluates the same positions at many different times. Only for graphs that implement
+        _get_distance_heuristic."""
+        xy = (tc.x, tc.y)
+        heuristic = self._distance_heuristic_cache.get(xy)
+        if heuristic is None:
+            heuristic = self._get_distance_heuristic(tc=tc)
+            self._distance_heuristic_cache[xy] = heuristic
+
+        return heuristic
+
     @abstractmethod
     def completes_goal(self, tc: TimeCoordinate) -> bool:
         """Whether the current TimeCoordinate completes the goal.
@@ -133,14 +195,19 @@ class Graph(metaclass=ABCMeta):
         ...
 
 
-@dataclass
+@dataclass(eq=False)
 class GoalGraph(Graph):
     goal: Coordinate
 
     def __post_init__(self) -> None:
+        super().__post_init__()
         self.last_action_cost = self.time_to_power_cost + MoveAction.get_move_onto_cost(
             self.unit_cfg, self.goal, self.board
         )
+        self._last_action_extra_cost = self.last_action_cost - self._min_cost_per_step
+        # Goal position stored as ints, so distances in the hot loop are computed without method calls
+        self._goal_x = self.goal.x
+        self._goal_y = self.goal.y
 
     def __repr__(self) -> str:
         return (
@@ -151,24 +218,24 @@ class GoalGraph(Graph):
         )
 
     def get_heuristic(self, tc: TimeCoordinate) -> float:
-        return self._get_distance_heuristic(tc=tc)
+        return self._get_cached_distance_heuristic(tc=tc)
 
     def _get_distance_heuristic(self, tc: TimeCoordinate) -> float:
-        min_nr_steps = tc.distance_to(self.goal)
+        min_nr_steps = abs(tc.x - self._goal_x) + abs(tc.y - self._goal_y)
         if min_nr_steps == 0:
             return 0
 
-        min_cost_per_step = self.time_to_power_cost + self.unit_cfg.MOVE_COST
-        min_distance_cost = (min_nr_steps - 1) * min_cost_per_step + self.last_action_cost
+        min_distance_cost = min_nr_steps * self._min_cost_per_step + self._last_action_extra_cost
         return min_distance_cost
 
     def completes_goal(self, tc: TimeCoordinate) -> bool:
-        return self.goal == tc
+        return self._goal_x == tc.x and self._goal_y == tc.y
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, eq=False)
 class FleeGraph(Graph):
-    _potential_actions = [MoveAction(direction) for direction in Direction]
+    _potential_actions = MOVE_ACTIONS
+    _only_move_actions = True
 
     def __repr__(self) -> str:
         return (
@@ -179,11 +246,10 @@ class FleeGraph(Graph):
         )
 
     def _is_valid_action_node(self, action: UnitAction, to_c: TimeCoordinate) -> bool:
-        return not self.constraints.tc_violates_constraint(to_c) and self.board.is_valid_c_for_player(c=to_c)
+        return self.board.is_valid_c_for_player(c=to_c) and (to_c.x, to_c.y, to_c.t) not in self.constraints.negative
 
-    def _get_potential_actions(self, tc: TimeCoordinate) -> Generator[UnitAction, None, None]:
-        for action in self._potential_actions:
-            yield action
+    def _get_potential_actions(self, tc: TimeCoordinate) -> Tuple[MoveAction, ...]:
+        return self._potential_actions
 
     def _get_danger_cost(self, action: UnitAction, to_c: TimeCoordinate) -> float:
         base_danger_cost = super()._get_danger_cost(action, to_c)
@@ -197,108 +263,114 @@ class FleeTowardsAnyFactoryGraph(FleeGraph):
 
     def get_heuristic(self, tc: TimeCoordinate) -> float:
         min_nr_steps = self.board.get_min_distance_to_any_player_factory(tc)
-        min_cost_per_step = self.time_to_power_cost + self.unit_cfg.MOVE_COST
-        min_distance_cost = min_nr_steps * min_cost_per_step
+        min_distance_cost = min_nr_steps * self._min_cost_per_step
         return min_distance_cost
 
 
-@dataclass
+@dataclass(eq=False)
 class FleeDistanceGraph(FleeGraph):
     start_tc: TimeCoordinate
     distance: int
-    _potential_actions = [MoveAction(direction) for direction in Direction if direction != Direction.CENTER]
+    _potential_actions = NON_STATIONARY_MOVE_ACTIONS
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self._start_x = self.start_tc.x
+        self._start_y = self.start_tc.y
 
     def completes_goal(self, tc: TimeCoordinate) -> bool:
-        return tc.distance_to(self.start_tc) >= self.distance
+        return abs(tc.x - self._start_x) + abs(tc.y - self._start_y) >= self.distance
 
     def get_heuristic(self, tc: TimeCoordinate) -> float:
-        min_nr_steps = self.distance - tc.distance_to(self.start_tc)
-        min_cost_per_step = self.time_to_power_cost + self.unit_cfg.MOVE_COST
-        min_distance_cost = min_nr_steps * min_cost_per_step
+        min_nr_steps = self.distance - (abs(tc.x - self._start_x) + abs(tc.y - self._start_y))
+        min_distance_cost = min_nr_steps * self._min_cost_per_step
         return min_distance_cost
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, eq=False)
 class TilesToClearGraph(GoalGraph):
     time_to_power_cost: int = field(init=False, default=CONFIG.OPTIMAL_PATH_TIME_TO_POWER_COST)
     unit_cfg: UnitConfig = field(init=False, default=HEAVY_CONFIG)
     unit_type: str = field(init=False, default="HEAVY")
     constraints: Constraints = field(init=False, default_factory=Constraints)
     goal: Coordinate
-    _potential_actions = [MoveAction(direction) for direction in Direction if direction != direction.CENTER]
+    _potential_actions = NON_STATIONARY_MOVE_ACTIONS
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self._cost_to_enter = self._get_cost_to_enter_grid()
+
+    def _get_cost_to_enter_grid(self) -> list[list[float]]:
+        """Computes the edge cost of moving onto each tile for the whole board at once. Only non-stationary moves are
+        considered in this graph, so the cost of an edge only depends on the tile moved onto."""
+        board = self.board
+        move_power_cost = np.array(self._move_onto_power_costs)
+        resource_cost = np.where((board.ice > 0) | (board.ore > 0), 100, 0)
+        cost_to_enter = move_power_cost + self.time_to_power_cost + resource_cost
+        return cost_to_enter.tolist()
 
     def _is_valid_action_node(self, action: UnitAction, to_c: TimeCoordinate) -> bool:
         return self.board.is_valid_c_for_player(c=to_c)
 
     def get_cost(self, action: UnitAction, to_c: TimeCoordinate) -> float:
-        action_power_cost = self._get_power_cost(action=action, to_c=to_c)
-        resource_cost = 100 if self.board.is_resource_c(to_c) else 0
-        total_cost = action_power_cost + self.time_to_power_cost + resource_cost
-        return total_cost
+        return self._cost_to_enter[to_c.x][to_c.y]
 
     # TODO, consider is_valid_action node to exclude resource tiles Or at least a big extra cost
-    def _get_potential_actions(self, tc: TimeCoordinate) -> List[MoveAction]:
+    def _get_potential_actions(self, tc: TimeCoordinate) -> Tuple[MoveAction, ...]:
         return self._potential_actions
 
-    def get_heuristic(self, tc: TimeCoordinate) -> float:
-        return self._get_distance_heuristic(tc=tc)
-
 
-@dataclass(repr=False)
+@dataclass(repr=False, eq=False)
 class MoveToGraph(GoalGraph):
-    _potential_actions = [MoveAction(direction) for direction in Direction]
+    _potential_actions = MOVE_ACTIONS
+    _only_move_actions = True
 
     def __post_init__(self):
         super().__post_init__()
         if not self.constraints:
-            self._potential_actions = [MoveAction(dir) for dir in Direction if dir != Direction.CENTER]
+            self._potential_actions = NON_STATIONARY_MOVE_ACTIONS
 
-    def _get_potential_actions(self, tc: TimeCoordinate) -> List[MoveAction]:
+    def _get_potential_actions(self, tc: TimeCoordinate) -> Tuple[MoveAction, ...]:
         return self._potential_actions
 
-    def get_heuristic(self, tc: TimeCoordinate) -> float:
-        return self._get_distance_heuristic(tc=tc)
-
 
-@dataclass(repr=False)
+@dataclass(repr=False, eq=False)
 class MoveNearCoordinateGraph(GoalGraph):
     distance: int
-    _potential_actions = [MoveAction(direction) for direction in Direction]
+    _potential_actions = MOVE_ACTIONS
+    _only_move_actions = True
 
     def __post_init__(self):
+        super().__post_init__()
         if not self.constraints:
-            self._potential_actions = [MoveAction(dir) for dir in Direction if dir != Direction.CENTER]
+            self._potential_actions = NON_STATIONARY_MOVE_ACTIONS
 
-    def _get_potential_actions(self, tc: TimeCoordinate) -> Generator[UnitAction, None, None]:
-        for action in self._potential_actions:
-            yield action
-
-    def get_heuristic(self, tc: TimeCoordinate) -> float:
-        return self._get_distance_heuristic(tc=tc)
+    def _get_potential_actions(self, tc: TimeCoordinate) -> Tuple[MoveAction, ...]:
+        return self._potential_actions
 
     def _get_distance_heuristic(self, tc: TimeCoordinate) -> float:
         min_nr_steps = self._get_distance_near_goal(tc)
-        min_cost_per_step = self.time_to_power_cost + self.unit_cfg.MOVE_COST
-        min_distance_cost = min_nr_steps * min_cost_per_step
+        min_distance_cost = min_nr_steps * self._min_cost_per_step
         return min_distance_cost
 
     def _get_distance_near_goal(self, to_tc: TimeCoordinate) -> int:
-        distance_to_goal = self.goal.distance_to(to_tc)
+        distance_to_goal = abs(to_tc.x - self._goal_x) + abs(to_tc.y - self._goal_y)
         difference_required_distance = abs(distance_to_goal - self.distance)
         return difference_required_distance
 
     def completes_goal(self, tc: Coordinate) -> bool:
-        return self.goal.distance_to(tc) == self.distance
+        return self._get_distance_near_goal(tc) == 0
 
 
-@dataclass
+@dataclass(eq=False)
 class MoveRecklessNearCoordinateGraph(MoveNearCoordinateGraph):
     def _is_valid_action_node(self, action: UnitAction, to_c: TimeCoordinate) -> bool:
-        return not self.constraints.tc_violates_constraint(to_c) and self.board.is_valid_c_for_player(c=to_c)
+        return self.board.is_valid_c_for_player(c=to_c) and (to_c.x, to_c.y, to_c.t) not in self.constraints.negative
 
 
 class EvadeConstraintsGraph(Graph):
-    _potential_actions = [MoveAction(direction) for direction in Direction]
+    _potential_actions = MOVE_ACTIONS
+    _only_move_actions = True
     _move_center_action = MoveAction(Direction.CENTER)
 
     def __repr__(self) -> str:
@@ -310,14 +382,14 @@ class EvadeConstraintsGraph(Graph):
         )
 
     def _is_valid_action_node(self, action: UnitAction, to_c: TimeCoordinate) -> bool:
-        return not self.constraints.tc_violates_constraint(to_c) and self.board.is_valid_c_for_player(c=to_c)
+        return self.board.is_valid_c_for_player(c=to_c) and (to_c.x, to_c.y, to_c.t) not in self.constraints.negative
 
     def _get_danger_cost(self, action: UnitAction, to_c: TimeCoordinate) -> float:
         base_danger_cost = super()._get_danger_cost(action, to_c)
         constraints_danger_cost = self.constraints.get_danger_cost(to_c, action.is_stationary)
         return base_danger_cost + constraints_danger_cost
 
-    def _get_potential_actions(self, tc: TimeCoordinate) -> List[MoveAction]:
+    def _get_potential_actions(self, tc: TimeCoordinate) -> Tuple[MoveAction, ...]:
         return self._potential_actions
 
     def get_heuristic(self, tc: TimeCoordinate) -> float:
@@ -328,12 +400,12 @@ class EvadeConstraintsGraph(Graph):
         return not self.constraints.tc_violates_constraint(to_c)
 
 
-@dataclass
+@dataclass(eq=False)
 class PickupPowerGraph(Graph):
     power_tracker: PowerTracker
     later_pickup: bool
     next_goal_c: Optional[Coordinate] = field(default=None)
-    _potential_move_actions = [MoveAction(direction) for direction in Direction]
+    _potential_move_actions = MOVE_ACTIONS
 
     def __repr__(self) -> str:
         return (
@@ -342,10 +414,13 @@ class PickupPowerGraph(Graph):
             f"power_tracker={self.power_tracker} constraints={self.constraints}, unit_cfg={self.unit_cfg})"
         )
 
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self._power_available_cache: dict[tuple[int, int, int], int] = {}
+
     def _get_potential_actions(self, tc: ResourcePowerTimeCoordinate) -> Generator[UnitAction, None, None]:
         if self.board.is_player_factory_tile(c=tc):
-            factory = self.board.get_closest_player_factory(c=tc)
-            power_available_in_factory = self.power_tracker.get_power_available(factory, tc.t)
+            power_available_in_factory = self._get_power_available_in_factory(tc)
             if power_available_in_factory:
                 battery_space_left = self.unit_cfg.BATTERY_CAPACITY - tc.p - self.unit_cfg.CHARGE
                 power_pickup_amount = min(battery_space_left, power_available_in_factory, 3000)
@@ -357,14 +432,23 @@ class PickupPowerGraph(Graph):
         for action in self._potential_move_actions:
             yield action
 
+    def _get_power_available_in_factory(self, tc: TimeCoordinate) -> int:
+        key = (tc.x, tc.y, tc.t)
+        power_available = self._power_available_cache.get(key)
+        if power_available is None:
+            factory = self.board.get_closest_player_factory(c=tc)
+            power_available = self.power_tracker.get_power_available(factory, tc.t)
+            self._power_available_cache[key] = power_available
+
+        return power_available
+
     def get_cost(self, action: UnitAction, to_c: TimeCoordinate) -> float:
         move_cost = super().get_cost(action, to_c)
-        if self.next_goal_c is None or not isinstance(action, PickupAction):
+        if self.next_goal_c is None or action.action_identifier != PickupAction.action_identifier:
             return move_cost
 
         distance_to_goal = to_c.distance_to(self.next_goal_c)
-        min_cost_per_step = self.time_to_power_cost + self.unit_cfg.MOVE_COST
-        min_distance_cost = distance_to_goal * min_cost_per_step
+        min_distance_cost = distance_to_goal * self._min_cost_per_step
         # prefering picking up earlier to reduce changes of unit not being able to make it to the
         if self.later_pickup:
             heuristic_preference_pickup = -1 * to_c.t / 100
@@ -376,8 +460,9 @@ class PickupPowerGraph(Graph):
         if self.completes_goal(tc):
             return 0
 
-        min_distance_cost = self._get_distance_heuristic(tc=tc)
-        min_time_recharge_cost = self._get_time_supply_heuristic(tc=tc)
+        min_distance_cost = self._get_cached_distance_heuristic(tc=tc)
+        # The goal is not completed yet, so at least one more turn is needed to pick up the power
+        min_time_recharge_cost = self.time_to_power_cost
         return min_distance_cost + min_time_recharge_cost
 
     def _get_distance_heuristic(self, tc: TimeCoordinate) -> float:
@@ -392,27 +477,26 @@ class PickupPowerGraph(Graph):
         else:
             total_distance = distance_to_closest_factory_tiles
 
-        min_cost_per_step = self.time_to_power_cost + self.unit_cfg.MOVE_COST
-        min_distance_cost = total_distance * min_cost_per_step
+        min_distance_cost = total_distance * self._min_cost_per_step
 
         return min_distance_cost
 
-    def _get_time_supply_heuristic(self, tc: ResourcePowerTimeCoordinate) -> float:
-        if self.completes_goal(tc=tc):
-            return 0
-        else:
-            return self.time_to_power_cost
-
     def completes_goal(self, tc: ResourcePowerTimeCoordinate) -> bool:
         return tc.q > 0
 
 
-@dataclass
+@dataclass(eq=False)
 class TransferResourceGraph(Graph):
-    _potential_move_actions = [MoveAction(direction) for direction in Direction]
+    _potential_move_actions = MOVE_ACTIONS
     resource: Resource
     q: int
 
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        min_transfer_cost = self.time_to_power_cost
+        resource_cost = self.q if self.resource == Resource.POWER else 0
+        self._min_transfer_and_resource_cost = min_transfer_cost + resource_cost
+
     def _get_potential_actions(self, tc: ResourcePowerTimeCoordinate) -> Generator[UnitAction, None, None]:
         if self._can_transfer(tc):
             receiving_tile = self._get_receiving_tile(tc)
@@ -439,10 +523,8 @@ class TransferResourceGraph(Graph):
         if self.completes_goal(tc):
             return 0
 
-        min_distance_cost = self._get_distance_heuristic(tc=tc)
-        min_transfer_cost = self.time_to_power_cost
-        resource_cost = self.q if self.resource == Resource.POWER else 0
-        return min_distance_cost + min_transfer_cost + resource_cost
+        min_distance_cost = self._get_cached_distance_heuristic(tc=tc)
+        return min_distance_cost + self._min_transfer_and_resource_cost
 
     @abstractmethod
     def _get_distance_heuristic(self, tc: TimeCoordinate) -> float:
@@ -452,7 +534,7 @@ class TransferResourceGraph(Graph):
         return tc.q < 0
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, eq=False)
 class TransferPowerToUnitResourceGraph(TransferResourceGraph):
     receiving_unit_c: Coordinate
 
@@ -465,21 +547,28 @@ class TransferPowerToUnitResourceGraph(TransferResourceGraph):
             f"unit_cfg={self.unit_cfg})"
         )
 
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self._receiving_unit_x = self.receiving_unit_c.x
+        self._receiving_unit_y = self.receiving_unit_c.y
+
+    def _get_distance_to_receiving_unit(self, tc: TimeCoordinate) -> int:
+        return abs(tc.x - self._receiving_unit_x) + abs(tc.y - self._receiving_unit_y)
+
     def _can_transfer(self, tc: TimeCoordinate) -> bool:
-        return tc.distance_to(self.receiving_unit_c) == 1
+        return self._get_distance_to_receiving_unit(tc) == 1
 
     def _get_receiving_tile(self, tc: TimeCoordinate) -> Coordinate:
         return self.receiving_unit_c
 
     def _get_distance_heuristic(self, tc: TimeCoordinate) -> float:
-        distance_to_unit = tc.distance_to(self.receiving_unit_c)
-        min_nr_steps_next_to_unit = max(distance_to_unit - 1, 0)
-        min_cost_per_step = self.time_to_power_cost + self.unit_cfg.MOVE_COST
-        min_distance_cost = min_nr_steps_next_to_unit * min_cost_per_step
+        distance_to_unit = self._get_distance_to_receiving_unit(tc)
+        min_nr_steps_next_to_unit = distance_to_unit - 1 if distance_to_unit > 0 else 0
+        min_distance_cost = min_nr_steps_next_to_unit * self._min_cost_per_step
         return min_distance_cost
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, eq=False)
 class TransferToFactoryResourceGraph(TransferResourceGraph):
     factory: Optional[Factory] = field(default=None)
 
@@ -518,42 +607,54 @@ class TransferToFactoryResourceGraph(TransferResourceGraph):
         else:
             min_nr_steps_to_factory = self.board.get_min_distance_to_player_factory(tc, self.factory.strain_id)
 
-        min_nr_steps_next_to_factory = max(min_nr_steps_to_factory - 1, 0)
-        min_cost_per_step = self.time_to_power_cost + self.unit_cfg.MOVE_COST
-        min_distance_cost = min_nr_steps_next_to_factory * min_cost_per_step
+        min_nr_steps_next_to_factory = min_nr_steps_to_factory - 1 if min_nr_steps_to_factory > 0 else 0
+        min_distance_cost = min_nr_steps_next_to_factory * self._min_cost_per_step
         return min_distance_cost
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, eq=False)
 class DigAtGraph(GoalGraph):
     goal: DigCoordinate
-    _potential_move_actions = [MoveAction(direction) for direction in Direction]
+    _potential_move_actions = MOVE_ACTIONS
     _potential_dig_action = DigAction()
 
     def __post_init__(self):
         super().__post_init__()
         if not self.constraints:
-            self._potential_move_actions = [
-                MoveAction(direction) for direction in Direction if direction != direction.CENTER
-            ]
+            self._potential_move_actions = NON_STATIONARY_MOVE_ACTIONS
 
-    def _get_potential_actions(self, tc: TimeCoordinate) -> Generator[UnitAction, None, None]:
-        if self.goal.x == tc.x and self.goal.y == tc.y:
-            yield self._potential_dig_action
+        # The action set only depends on whether the unit is on the goal, so both variants are built once
+        self._potential_actions_on_goal = (self._potential_dig_action, *self._potential_move_actions)
+        self._cost_per_dig = self.unit_cfg.DIG_COST + self.time_to_power_cost
 
-        for action in self._potential_move_actions:
-            yield action
+    def _get_potential_actions(self, tc: TimeCoordinate) -> Tuple[UnitAction, ...]:
+        if self._goal_x == tc.x and self._goal_y == tc.y:
+            return self._potential_actions_on_goal
+
+        return self._potential_move_actions
+
+    def can_complete_goal_by_digging(self, tc: DigTimeCoordinate) -> bool:
+        """Whether digging in place is a valid action that completes the goal. Any other path needs the same dig
+        later on, plus the cost of the extra steps, so in that case digging in place is the optimal solution.
+
+        Args:
+            tc: Current DigTimeCoordinate
+
+        Returns:
+            Boolean, can the goal be completed by digging in place?
+        """
+        to_tc = tc.add_action(self._potential_dig_action)
+        return self.completes_goal(to_tc) and self._is_valid_action_node(self._potential_dig_action, to_tc)
 
     def get_heuristic(self, tc: DigTimeCoordinate) -> float:
-        distance_min_cost = self._get_distance_heuristic(tc=tc)
+        distance_min_cost = self._get_cached_distance_heuristic(tc=tc)
         digs_min_cost = self._get_digs_min_cost(tc=tc)
 
         return distance_min_cost + digs_min_cost
 
     def _get_digs_min_cost(self, tc: DigTimeCoordinate) -> float:
         nr_digs_required = self.goal.d - tc.d
-        cost_per_dig = self.unit_cfg.DIG_COST + self.time_to_power_cost
-        min_cost = nr_digs_required * cost_per_dig
+        min_cost = nr_digs_required * self._cost_per_dig
         return min_cost
 
     def completes_goal(self, tc: DigTimeCoordinate) -> bool:
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import itertools
 from typing import List, Optional
 
 from config import CONFIG
@@ -17,6 +16,7 @@ class Search:
 
         self.came_from: dict[Coordinate, tuple[UnitAction, Coordinate]] = {}
         self.cost_so_far: dict[Coordinate, float] = {}
+        self.expanded: set[Coordinate] = set()
         self.graph = graph
 
     def get_actions_to_complete_goal(self, start: Coordinate, budget: Optional[int] = None) -> List[UnitAction]:
@@ -29,33 +29,54 @@ class Search:
         self.cost_so_far[self._start] = 0
         self.frontier.put(self._start, 0)
 
-    def _find_optimal_solution(self, budget: Optional[int] = None) -> Coordinate:  # type: ignore
+    def _find_optimal_solution(self, budget: Optional[int] = None) -> Coordinate:
         if not budget:
             budget = CONFIG.SEARCH_BUDGET_HEAVY if self.graph.unit_type == "HEAVY" else CONFIG.SEARCH_BUDGET_LIGHT
 
-        for i in itertools.count():
-            if self.frontier.is_empty():
+        # Loop invariant attributes and bound methods stored as locals, since this is the hot loop of the search
+        frontier = self.frontier
+        expanded = self.expanded
+        cost_so_far = self.cost_so_far
+        completes_goal = self.graph.completes_goal
+        get_valid_action_nodes = self.graph.get_valid_action_nodes
+        get_cost = self.graph.get_cost
+
+        for _ in range(budget + 1):
+            if frontier.is_empty():
                 raise NoSolutionSearchError(self._start, self.graph)
-            if i > budget:
-                raise SolutionSearchNotFoundWithinBudgetError(self._start, self.graph)
 
-            current_node = self.frontier.pop()
+            current_node = frontier.pop()
+
+            # Nodes are pushed again when a cheaper path is found, instead of updating their priority. Skip the stale
+            # entries of nodes that have already been expanded at their current cost.
+            if current_node in expanded:
+                continue
+
+            expanded.add(current_node)
 
-            if self.graph.completes_goal(tc=current_node):
+            if completes_goal(tc=current_node):
                 return current_node
 
-            current_cost = self.cost_so_far[current_node]
+            current_cost = cost_so_far[current_node]
 
-            for action, next_node in self.graph.get_valid_action_nodes(current_node):
-                new_cost = current_cost + self.graph.get_cost(action=action, to_c=next_node)
-                if next_node not in self.cost_so_far or new_cost < self.cost_so_far[next_node]:
+            for action, next_node in get_valid_action_nodes(current_node):
+                new_cost = current_cost + get_cost(action=action, to_c=next_node)
+                # Single lookup, hashing the nodes is a significant part of the cost of the search
+                old_cost = cost_so_far.get(next_node)
+                if old_cost is None or new_cost < old_cost:
                     self._add_node(node=next_node, action=action, current_node=current_node, node_cost=new_cost)
 
+        if frontier.is_empty():
+            raise NoSolutionSearchError(self._start, self.graph)
+
+        raise SolutionSearchNotFoundWithinBudgetError(self._start, self.graph)
+
     def _add_node(
         self, node: TimeCoordinate, action: UnitAction, current_node: TimeCoordinate, node_cost: float
     ) -> None:
         self.cost_so_far[node] = node_cost
         self.came_from[node] = (action, current_node)
+        self.expanded.discard(node)
 
         priority = node_cost + self.graph.get_heuristic(node)
         self.frontier.put(node, priority)
@@ -66,6 +87,7 @@ class Search:
 
         while cur_c in self.came_from:
             action, cur_c = self.came_from[cur_c]
-            solution.insert(0, action)
+            solution.append(action)
 
+        solution.reverse()
         return solution
@@ -4,6 +4,8 @@ from lux.config import EnvConfig
 from objects.coordinate import Coordinate as C
 from tests.generate_game_state import FactoryPos, FactoryPositions
 from tests.generate_game_state import LichenTile as LT
+from tests.generate_game_state import ResourceTile as RT
+from tests.generate_game_state import RubbleTile
 from tests.generate_game_state import Tiles, get_state
 
 ENV_CFG = EnvConfig()
@@ -249,5 +251,65 @@ class TestClosestPlayerFactoryTile(unittest.TestCase):
         self.assertEqual(expected_tile, closest_tile)
 
 
+class TestIsResourceNextToPlayerFactory(unittest.TestCase):
+    def _test_is_resource_next_to_player_factory(self, c: C, tiles: Tiles, expected: bool) -> None:
+        factory_positions = FactoryPositions(player=[FactoryPos(3, 3)], opp=[FactoryPos(10, 10)])
+
+        state = get_state(tiles=tiles, factory_positions=factory_positions)
+        board = state.board
+
+        self.assertEqual(expected, board.is_resource_next_to_player_factory(c))
+
+    def test_ice_next_to_factory(self):
+        c = C(5, 3)
+        tiles = Tiles(ice=[RT(5, 3)])
+        self._test_is_resource_next_to_player_factory(c, tiles, expected=True)
+
+    def test_ore_next_to_factory(self):
+        c = C(3, 1)
+        tiles = Tiles(ore=[RT(3, 1)])
+        self._test_is_resource_next_to_player_factory(c, tiles, expected=True)
+
+    def test_ice_further_away_from_factory(self):
+        c = C(6, 3)
+        tiles = Tiles(ice=[RT(6, 3)])
+        self._test_is_resource_next_to_player_factory(c, tiles, expected=False)
+
+    def test_no_resource_next_to_factory(self):
+        c = C(5, 3)
+        tiles = Tiles(ice=[RT(6, 3)])
+        self._test_is_resource_next_to_player_factory(c, tiles, expected=False)
+
+    def test_ice_next_to_opponent_factory(self):
+        c = C(12, 10)
+        tiles = Tiles(ice=[RT(12, 10)])
+        self._test_is_resource_next_to_player_factory(c, tiles, expected=False)
+
+
+class TestMoveOntoPowerCosts(unittest.TestCase):
+    def _test_move_onto_power_cost(self, c: C, tiles: Tiles, unit_type: str, expected: int):
+        state = get_state(tiles=tiles)
+        board = state.board
+        unit_cfg = ENV_CFG.get_unit_config(unit_type)
+
+        move_onto_power_costs = board.get_move_onto_power_costs(unit_cfg)
+        self.assertEqual(expected, move_onto_power_costs[c.x][c.y])
+
+    def test_light_no_rubble(self):
+        c = C(5, 5)
+        tiles = Tiles()
+        self._test_move_onto_power_cost(c, tiles, unit_type="LIGHT", expected=1)
+
+    def test_light_rubble(self):
+        c = C(5, 5)
+        tiles = Tiles(rubble=[RubbleTile(5, 5, 30)])
+        self._test_move_onto_power_cost(c, tiles, unit_type="LIGHT", expected=2)
+
+    def test_heavy_rubble(self):
+        c = C(5, 5)
+        tiles = Tiles(rubble=[RubbleTile(5, 5, 30)])
+        self._test_move_onto_power_cost(c, tiles, unit_type="HEAVY", expected=50)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -203,6 +203,22 @@ class TestGetNClosestPositionsBetweenPositions(unittest.TestCase):
         expected = np.array([[1, 2]])
         self._test_expected(a, b, n, expected)
 
+    def test_sorted_on_distance(self):
+        a = np.array([[30, 30], [0, 0], [15, 15]])
+        b = np.array([[0, 0], [15, 16], [30, 32]])
+        n = 2
+
+        expected = np.array([[0, 0], [15, 15]])
+        self._test_expected(a, b, n, expected)
+
+    def test_n_larger_than_nr_positions(self):
+        a = np.array([[30, 30], [0, 0], [15, 15]])
+        b = np.array([[0, 0], [15, 16], [30, 32]])
+        n = 5
+
+        expected = np.array([[0, 0], [15, 15], [30, 30]])
+        self._test_expected(a, b, n, expected)
+
 
 class TestGetDistanceBetweenPosAndPos(unittest.TestCase):
     def _test_expected(self, a: np.ndarray, b: np.ndarray, expected: int) -> None:
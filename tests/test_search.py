@@ -1,4 +1,5 @@
 import unittest
+from functools import lru_cache
 from typing import Optional, Sequence
 
 from logic.constraints import Constraints
@@ -30,6 +31,12 @@ ENV_CFG = EnvConfig()
 LIGHT_CFG = ENV_CFG.LIGHT_ROBOT
 
 
+@lru_cache(maxsize=None)
+def get_default_state() -> GameState:
+    """Default state without tiles or factories. Searching does not modify the board, so it is shared by tests."""
+    return get_state()
+
+
 class TestMoveToSearch(unittest.TestCase):
     def _test_move_to_search(
         self,
@@ -63,7 +70,7 @@ class TestMoveToSearch(unittest.TestCase):
     def test_already_there_path(self):
         start = TC(3, 3, 0)
         goal = C(3, 3)
-        state = get_state()
+        state = get_default_state()
         expected_actions = []
 
         self._test_move_to_search(state=state, start=start, goal=goal, expected_actions=expected_actions)
@@ -72,7 +79,7 @@ class TestMoveToSearch(unittest.TestCase):
 
         start = TC(3, 2, 0)
         goal = C(3, 3)
-        state = get_state()
+        state = get_default_state()
         expected_actions = [MA(D.DOWN)]
 
         self._test_move_to_search(state=state, start=start, goal=goal, expected_actions=expected_actions)
@@ -115,7 +122,7 @@ class TestMoveToSearch(unittest.TestCase):
         constraints = init_constraints(negative_constraints=[TC(3, 2, 1)])
         expected_actions = [MA(D.CENTER), MA(D.RIGHT), MA(D.RIGHT), MA(D.RIGHT)]
 
-        state = get_state()
+        state = get_default_state()
 
         self._test_move_to_search(
             state=state, start=start, goal=goal, expected_actions=expected_actions, constraints=constraints
@@ -128,7 +135,7 @@ class TestMoveToSearch(unittest.TestCase):
 
         expected_actions = [MA(D.RIGHT), MA(D.RIGHT), MA(D.CENTER), MA(D.RIGHT)]
 
-        state = get_state()
+        state = get_default_state()
 
         self._test_move_to_search(
             state=state, start=start, goal=goal, expected_actions=expected_actions, constraints=constraints
@@ -253,7 +260,7 @@ class DigAtSearch(unittest.TestCase):
     def test_already_there_path(self):
         start = DTC(3, 3, 0, 0)
         goal = DC(3, 3, 3)
-        state = get_state()
+        state = get_default_state()
         expected_actions = [DA()] * 3
 
         self._test_dig_at_search(state=state, start=start, goal=goal, expected_actions=expected_actions)
@@ -261,7 +268,7 @@ class DigAtSearch(unittest.TestCase):
     def test_one_down_path(self):
         start = DTC(3, 2, 0, 0)
         goal = DC(3, 3, 3)
-        state = get_state()
+        state = get_default_state()
         expected_actions = [MA(D.DOWN)] + [DA()] * 3
 
         self._test_dig_at_search(state=state, start=start, goal=goal, expected_actions=expected_actions)
@@ -311,7 +318,7 @@ class DigAtSearch(unittest.TestCase):
 
         expected_actions = [MA(D.CENTER)] + [MA(D.RIGHT)] * 3 + [DA()] * 3
 
-        state = get_state()
+        state = get_default_state()
 
         self._test_dig_at_search(
             state=state, start=start, goal=goal, expected_actions=expected_actions, constraints=constraints
@@ -323,7 +330,7 @@ class DigAtSearch(unittest.TestCase):
         constraints = init_constraints(negative_constraints=[TC(5, 2, 3)])
         expected_actions = [MA(D.RIGHT), MA(D.RIGHT), MA(D.CENTER), MA(D.RIGHT)] + [DA()] * 3
 
-        state = get_state()
+        state = get_default_state()
 
         self._test_dig_at_search(
             state=state, start=start, goal=goal, expected_actions=expected_actions, constraints=constraints
@@ -335,7 +342,7 @@ class DigAtSearch(unittest.TestCase):
         constraints = init_constraints(negative_constraints=[TC(5, 2, 4)])
         expected_actions = [MA(D.RIGHT), MA(D.RIGHT), MA(D.CENTER), MA(D.CENTER), MA(D.RIGHT)] + [DA()] * 3
 
-        state = get_state()
+        state = get_default_state()
 
         self._test_dig_at_search(
             state=state, start=start, goal=goal, expected_actions=expected_actions, constraints=constraints
@@ -58,10 +58,15 @@ def get_min_distances_between_positions(a: np.ndarray, b: np.ndarray) -> np.ndar
 
 
 def get_n_closests_positions_between_positions(a: np.ndarray, b: np.ndarray, n: int) -> np.ndarray:
-    """Return the n positions in a that are closest to b"""
+    """Return the n positions in a that are closest to b, sorted on distance"""
     min_distances = get_min_distances_between_positions(a, b)
-    closest_indexes = np.argpartition(min_distances, n)[:n]
-    closest_positions = a[closest_indexes]
+    if n < len(a):
+        closest_indexes = np.argpartition(min_distances, n - 1)[:n]
+    else:
+        closest_indexes = np.arange(len(a))
+
+    sorted_closest_indexes = closest_indexes[np.argsort(min_distances[closest_indexes], kind="stable")]
+    closest_positions = a[sorted_closest_indexes]
     return closest_positions
 
 